@@ -16,7 +16,6 @@ package, which can be installed on top of the existing sunpy conda
 environment: ``conda install -c astropy astroquery`` and an active internet connection.
 """
 import matplotlib.pyplot as plt
-from astroquery.vizier import Vizier
 
 import astropy.units as u
 from astropy.coordinates import SkyCoord
@@ -45,16 +44,19 @@ sun_to_stereo = cor2.observer_coordinate.transform_to('hcrs')
 # We next reflect the vector to get our search vector which points from STEREO
 # to the Sun.
 
-stereo_to_sun = SkyCoord(-sun_to_stereo.spherical, obstime=sun_to_stereo.obstime, frame='hcrs')
+stereo_to_sun = SkyCoord(-sun_to_stereo.cartesian, obstime=sun_to_stereo.obstime, frame='hcrs',
+                         representation_type='spherical')
 
 ###############################################################################
 # Let's look up bright stars using the Vizier search capability provided by
 # astroquery.
 # We will search the GAIA2 star catalog for stars with magnitude
-# brighter than 7.
+# brighter than 7, requesting only the columns we need.
+
+from astroquery.vizier import Vizier
 
-vv = Vizier(columns=['**'], row_limit=-1, column_filters={'Gmag': '<7'}, timeout=1200)
-vv.ROW_LIMIT = -1
+vv = Vizier(columns=['RA_ICRS', 'DE_ICRS', 'Gmag'], row_limit=-1,
+            column_filters={'Gmag': '<7'}, timeout=1200)
 result = vv.query_region(stereo_to_sun, radius=4 * u.deg, catalog='I/345/gaia2')
 
 ###############################################################################
@@ -63,18 +65,23 @@ result = vv.query_region(stereo_to_sun, radius=4 * u.deg, catalog='I/345/gaia2')
 print(len(result[0]))
 
 ###############################################################################
-# Now we load each star into a coordinate and transform it into the COR2
-# image coordinates. Since we don't know the distance to each of these stars
-# we will just put them very far away.
+# Now we load each star into a coordinate. Since we don't know the distance to
+# each of these stars we will just put them very far away.
 
-tbl_crds = SkyCoord(result[0]['RA_ICRS'], result[0]['DE_ICRS'], 1000*u.lyr, frame='icrs')
-hpc_coords = tbl_crds.transform_to(cor2.coordinate_frame)
+tbl_crds = SkyCoord(ra=result[0]['RA_ICRS'].quantity, dec=result[0]['DE_ICRS'].quantity,
+                    distance=1000*u.lyr, frame='icrs')
 
 ###############################################################################
 # One of the bright features is actually Mars, so let's also get that coordinate.
 
 mars = get_body_heliographic_stonyhurst('mars', cor2.date, observer=cor2.observer_coordinate)
-mars_hpc = mars.transform_to(cor2.coordinate_frame)
+
+###############################################################################
+# We transform both the stars and Mars into the COR2 image coordinate frame.
+
+target_frame = cor2.coordinate_frame
+hpc_coords = tbl_crds.transform_to(target_frame)
+mars_hpc = mars.transform_to(target_frame)
 
 ###############################################################################
 # Let's plot the results.
@@ -91,7 +98,8 @@ cor2.draw_limb()
 
 # Plot the position of Mars
 ax.plot_coord(mars_hpc, 's', color='white', fillstyle='none', markersize=12, label='Mars')
-# Plot all of the stars
-ax.plot_coord(hpc_coords, 'o', color='white', fillstyle='none')
+# Plot all of the stars at their pixel positions in the map
+xpix, ypix = cor2.world_to_pixel(hpc_coords)
+ax.plot(xpix, ypix, 'o', color='white', fillstyle='none')
 plt.legend()
 plt.show()
@@ -5,6 +5,9 @@ from astropy.table import Table
 
 from sunpy.sun import constants as con
 
+_ITEMS = list(con.constants.items())
+_KEYS = [key for key, value in _ITEMS]
+
 
 def test_find_all():
     assert isinstance(con.find(), list)
@@ -17,35 +20,14 @@ def test_print_all():
     assert len(table) == 34
 
 
-@pytest.mark.parametrize('this_constant', [value for key, value in con.constants.items()])
-def test_all_constants_are_constants(this_constant):
+@pytest.mark.parametrize('this_key, this_constant', _ITEMS, ids=_KEYS)
+def test_constant_lookup(this_key, this_constant):
     """
-    Test that each member of the constants dict is an astropy Constant.
+    Test that each member of the constants dict is an astropy Constant and
+    that the get and find functions work for all the keys.
     """
     assert isinstance(this_constant, Constant)
-
-
-@pytest.mark.parametrize('this_key', [key for key, value in con.constants.items()])
-def test_get_function(this_key):
-    """
-    Test that the get function works for all the keys.
-    """
     assert isinstance(con.get(this_key), Constant)
-
-
-@pytest.mark.parametrize('this_key', [key for key, value in con.constants.items()])
-def test_find_function(this_key):
-    """
-    Test that the find function works for all the keys.
-    """
-    assert len(con.find(this_key)) >= 1
-
-
-@pytest.mark.parametrize('this_key', [key for key, value in con.constants.items()])
-def test_find_function2(this_key):
-    """
-    Test that the find function works for all the keys.
-    """
     assert len(con.find(this_key)) >= 1
 
 
@@ -2,7 +2,7 @@
 This module provides SunPy specific decorators.
 """
 import types
-import inspect
+import string
 import textwrap
 import warnings
 import functools
@@ -11,7 +11,27 @@ from sunpy.util.exceptions import SunpyDeprecationWarning, SunpyPendingDeprecati
 
 __all__ = ['deprecated']
 
+# Friendly names for the common types of deprecated objects, keyed on ``type(obj)``
+_TYPE_NAMES = {
+    type: 'class',
+    types.FunctionType: 'function',
+    types.MethodType: 'method',
+    classmethod: 'method',
+    staticmethod: 'method',
+}
 
+# This crazy way to get the type of a wrapper descriptor is straight out of
+# the Python 3.3 inspect module docs; types.WrapperDescriptorType needs Python 3.7.
+_WRAPPER_DESCRIPTOR_TYPE = type(str.__dict__['__add__'])
+
+# Default deprecation messages, used when no custom message is given
+_PENDING_TEMPLATE = string.Template('The $func $obj_type will be deprecated in '
+                                    'version $deprecated_version.')
+_REMOVAL_TEMPLATE = string.Template('The $func $obj_type is deprecated and may '
+                                    'be removed in $future_version.')
+
+
+@functools.lru_cache(maxsize=None)
 def get_removal_version(since):
     # Work out which version this will be removed in
     since_major, since_minor = since.split('.')[:2]
@@ -25,8 +45,17 @@ def get_removal_version(since):
     return major, minor
 
 
+@functools.lru_cache(maxsize=None)
+def _deprecation_header(since, message):
+    """
+    Returns the ``deprecated`` directive that is prepended to the docstring
+    of a deprecated object.
+    """
+    return f'\n.. deprecated:: {since}\n    {message}\n\n'
+
+
 def deprecated(since, message='', name='', alternative='', pending=False,
-               obj_type=None):
+               obj_type=None, once=False):
     """
     Used to mark a function or class as deprecated.
 
@@ -70,6 +99,10 @@ def deprecated(since, message='', name='', alternative='', pending=False,
         The type of this object, if the automatically determined one
         needs to be overridden.
 
+    once : bool, optional
+        If True, the warning is only issued the first time the deprecated
+        object is called, rather than on every call.
+
     warning_type : warning
         Warning to be issued.
         Default is `~sunpy.utils.exceptions.SunpyDeprecationWarning`.
@@ -78,13 +111,13 @@ def deprecated(since, message='', name='', alternative='', pending=False,
     removal_version = f"{major}.{minor}"
     # TODO: replace this with the astropy deprecated decorator
     return _deprecated(since, message=message, name=name, alternative=alternative, pending=pending,
-                       removal_version=removal_version, obj_type=obj_type,
+                       removal_version=removal_version, obj_type=obj_type, once=once,
                        warning_type=SunpyDeprecationWarning,
                        pending_warning_type=SunpyPendingDeprecationWarning)
 
 
 def _deprecated(since, message='', name='', alternative='', pending=False, removal_version=None,
-                obj_type=None, warning_type=SunpyDeprecationWarning,
+                obj_type=None, once=False, warning_type=SunpyDeprecationWarning,
                 pending_warning_type=SunpyPendingDeprecationWarning):
     # TODO: remove this once the removal_version kwarg has been added to the upstream
     # astropy deprecated decorator
@@ -97,10 +130,11 @@ def _deprecated(since, message='', name='', alternative='', pending=False, remov
         """
         if not old_doc:
             old_doc = ''
-        old_doc = textwrap.dedent(old_doc).strip('\n')
-        new_doc = (('\n.. deprecated:: {since}'
-                    '\n    {message}\n\n'.format(
-                     **{'since': since, 'message': message.strip()})) + old_doc)
+        elif old_doc[:1].isspace() or '\n ' in old_doc or '\n\t' in old_doc:
+            # Only dedent when there is some indentation to remove
+            old_doc = textwrap.dedent(old_doc)
+        old_doc = old_doc.strip('\n')
+        new_doc = _deprecation_header(since, message.strip()) + old_doc
         if not old_doc:
             # This is to prevent a spurious 'unexpected unindent' warning from
             # docutils when the original docstring was blank.
@@ -129,21 +163,22 @@ def _deprecated(since, message='', name='', alternative='', pending=False, remov
 
         func = get_function(func)
 
-        def deprecated_func(*args, **kwargs):
-            if pending:
-                category = pending_warning_type
-            else:
-                category = warning_type
+        category = pending_warning_type if pending else warning_type
+
+        warned = False
 
-            warnings.warn(message, category, stacklevel=2)
+        def deprecated_func(*args, **kwargs):
+            nonlocal warned
+            if not warned:
+                warnings.warn(message, category, stacklevel=2)
+                # Only stop warning if we were asked to warn once
+                warned = once
 
             return func(*args, **kwargs)
 
         # If this is an extension function, we can't call
         # functools.wraps on it, but we normally don't care.
-        # This crazy way to get the type of a wrapper descriptor is
-        # straight out of the Python 3.3 inspect module docs.
-        if type(func) is not type(str.__dict__['__add__']):  # nopep8
+        if type(func) is not _WRAPPER_DESCRIPTOR_TYPE:
             deprecated_func = functools.wraps(func)(deprecated_func)
 
         deprecated_func.__doc__ = deprecate_doc(
@@ -177,52 +212,47 @@ def _deprecated(since, message='', name='', alternative='', pending=False, remov
 
     def deprecate(obj, message=message, name=name, alternative=alternative,
                   pending=pending, warning_type=warning_type):
-        if obj_type is None:
+        obj_type_name = obj_type or _TYPE_NAMES.get(type(obj))
+        if obj_type_name is None:
+            # Fall back to isinstance checks for metaclasses and subclasses
             if isinstance(obj, type):
                 obj_type_name = 'class'
-            elif inspect.isfunction(obj):
-                obj_type_name = 'function'
-            elif inspect.ismethod(obj) or isinstance(obj, method_types):
+            elif isinstance(obj, method_types):
                 obj_type_name = 'method'
             else:
                 obj_type_name = 'object'
-        else:
-            obj_type_name = obj_type
 
         if not name:
             name = get_function(obj).__name__
 
-        altmessage = ''
-        if not message or type(message) is type(deprecate):
-            if pending:
-                message = ('The {func} {obj_type} will be deprecated in '
-                           'version {deprecated_version}.')
-            else:
-                message = ('The {func} {obj_type} is deprecated and may '
-                           'be removed in {future_version}.')
-            if alternative:
-                altmessage = f'\n        Use {alternative} instead.'
-
         if removal_version is None:
             future_version = 'a future version'
         else:
             future_version = f'version {removal_version}'
 
-        message = ((message.format(**{
-            'func': name,
-            'name': name,
-            'deprecated_version': since,
-            'future_version': future_version,
-            'alternative': alternative,
-            'obj_type': obj_type_name})) +
-            altmessage)
+        if not message or callable(message):
+            template = _PENDING_TEMPLATE if pending else _REMOVAL_TEMPLATE
+            message = template.substitute(func=name, obj_type=obj_type_name,
+                                          deprecated_version=since,
+                                          future_version=future_version)
+            if alternative:
+                message += f'\n        Use {alternative} instead.'
+        else:
+            message = message.format(**{
+                'func': name,
+                'name': name,
+                'deprecated_version': since,
+                'future_version': future_version,
+                'alternative': alternative,
+                'obj_type': obj_type_name})
 
         if isinstance(obj, type):
             return deprecate_class(obj, message, warning_type)
         else:
             return deprecate_function(obj, message, warning_type)
 
-    if type(message) is type(deprecate):
+    if callable(message):
+        # The object to deprecate was passed directly in place of a message
         return deprecate(message)
 
     return deprecate
@@ -246,21 +276,18 @@ class add_common_docstring:
     """
 
     def __init__(self, append=None, prepend=None, **kwargs):
+        append = append if append else ''
+        prepend = prepend if prepend else ''
         if kwargs:
-            append = append
-            prepend = prepend
+            append = append.format(**kwargs)
+            prepend = prepend.format(**kwargs)
         self.append = append
         self.prepend = prepend
         self.kwargs = kwargs
 
     def __call__(self, func):
         func.__doc__ = func.__doc__ if func.__doc__ else ''
-        self.append = self.append if self.append else ''
-        self.prepend = self.prepend if self.prepend else ''
-        if self.append and isinstance(func.__doc__, str):
-            func.__doc__ += self.append
-        if self.prepend and isinstance(func.__doc__, str):
-            func.__doc__ = self.prepend + func.__doc__
         if self.kwargs:
             func.__doc__ = func.__doc__.format(**self.kwargs)
+        func.__doc__ = self.prepend + func.__doc__ + self.append
         return func
@@ -1,7 +1,7 @@
 import warnings
 import pytest
 
-from sunpy.util.decorators import get_removal_version, deprecated
+from sunpy.util.decorators import add_common_docstring, deprecated, get_removal_version
 from sunpy.util.exceptions import SunpyDeprecationWarning, SunpyPendingDeprecationWarning
 
 
@@ -37,3 +37,57 @@ def test_deprecated_warning_message(since, pending, warning, message, warning_me
     with pytest.warns(warning, match=warning_message):
         warnings.simplefilter('always')
         foo()
+
+
+def test_add_common_docstring():
+    @add_common_docstring(append=' Appended {value}.', prepend='Prepended {value}. ', value=1)
+    def foo():
+        """Docstring {value}."""
+
+    assert foo.__doc__ == 'Prepended 1. Docstring 1. Appended 1.'
+
+
+def test_deprecated_once():
+    @deprecated('2.0', once=True)
+    def foo():
+        return 1
+
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter('always')
+        assert foo() == 1
+        assert foo() == 1
+    assert len(record) == 1
+    assert record[0].category is SunpyDeprecationWarning
+
+
+def test_deprecated_once_methods():
+    class Foo:
+        @deprecated('2.0', once=True)
+        def method(self):
+            return 1
+
+        @deprecated('2.0', once=True)
+        @classmethod
+        def cmethod(cls):
+            return 2
+
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter('always')
+        assert Foo().method() == 1
+        assert Foo().method() == 1
+        assert Foo.cmethod() == 2
+        assert Foo.cmethod() == 2
+    assert len(record) == 2
+    assert all(r.category is SunpyDeprecationWarning for r in record)
+
+
+def test_deprecated_class_without_init():
+    @deprecated('2.0')
+    class Foo:
+        pass
+
+    with pytest.warns(SunpyDeprecationWarning, match='The Foo class is deprecated'):
+        Foo()
+    with pytest.warns(SunpyDeprecationWarning, match='The Foo class is deprecated'):
+        with pytest.raises(TypeError, match='takes exactly one argument'):
+            Foo(1)